@@ -3,6 +3,8 @@ from pathlib import Path
 import matplotlib.pyplot as plt
 from importlib import import_module
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 
 def save_demo(root: Path, module: str, name: str, force: bool) -> None:
@@ -12,22 +14,36 @@ def save_demo(root: Path, module: str, name: str, force: bool) -> None:
         return
     module = import_module(module)
     print(f"saving {path}")
+    # patched in the process that runs the demo, so workers don't clash
     plt.show = lambda: plt.savefig(path)
     module._demo()
 
 
+def _init_worker() -> None:
+    import torch
+
+    # demos run side by side, one torch thread pool each would oversubscribe
+    torch.set_num_threads(1)
+
+
 def main() -> None:
     parser = ArgumentParser()
     parser.add_argument("--force", action="store_true")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of demos to run in parallel (demos need a lot of RAM)",
+    )
     args = parser.parse_args()
-    gen_images(args.force)
+    gen_images(args.force, args.jobs)
 
 
-def gen_images(force: bool = False) -> None:
+def gen_images(force: bool = False, jobs: int = 1) -> None:
     root = Path(__file__).parent / "source" / "_static"
     root.mkdir(exist_ok=True, parents=True)
 
-    for module, name in (
+    demos = (
         # Distortions
         (
             "olimp.simulate.refraction_distortion",
@@ -72,8 +88,23 @@ def gen_images(force: bool = False) -> None:
             "olimp.precompensation.nn.models.cvd_swin.cvd_swin_3channels",
             "cvd_swin_3channels",
         ),
-    ):
-        save_demo(root, module, name, force)
+    )
+
+    if jobs == 1:
+        for module, name in demos:
+            save_demo(root, module, name, force)
+        return
+
+    # every demo is independent and writes its own file
+    modules, names = zip(*demos)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker
+    ) as executor:
+        list(
+            executor.map(
+                save_demo, repeat(root), modules, names, repeat(force)
+            )
+        )
 
 
 if __name__ == "__main__":
@@ -1,4 +1,33 @@
-from torch import tensor
+from __future__ import annotations
+from functools import lru_cache
+import torch
+from torch import Tensor, tensor
+
+from .srgb import sRGB
+from .cielab import CIELAB
+from .prolab import ProLab
 
 
 D65 = tensor((0.95047, 1.0, 1.08883))
+
+srgb_converter = sRGB()
+
+
+@lru_cache(maxsize=None)
+def _d65(device: torch.device) -> Tensor:
+    return D65.to(device=device)
+
+
+def srgb2lab(srgb: Tensor) -> Tensor:
+    """
+    sRGB with D65 whitepoint to CIELAB. The constants of the color spaces
+    are copied to the image device once per device, not on every call
+    """
+    return CIELAB(_d65(srgb.device)).from_XYZ(srgb_converter.to_XYZ(srgb))
+
+
+def srgb2prolab(srgb: Tensor) -> Tensor:
+    """
+    sRGB with D65 whitepoint to ProLab, see `srgb2lab`
+    """
+    return ProLab(_d65(srgb.device)).from_XYZ(srgb_converter.to_XYZ(srgb))
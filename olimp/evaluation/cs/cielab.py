@@ -3,6 +3,7 @@ https://en.wikipedia.org/wiki/Lab_color_space
 """
 
 from __future__ import annotations
+from functools import lru_cache
 import torch
 from torch import Tensor
 
@@ -49,7 +50,7 @@ class CIELAB:
             3, *((1,) * (color.dim() - 1))
         )
         return torch.tensordot(
-            self.A.to(device=color.device),
+            _matrices(color.device)[0],
             f(color / illuminant_xyz.to(device=color.device)),
             dims=1,
         )
@@ -59,10 +60,14 @@ class CIELAB:
             3, *((1,) * (color.dim() - 1))
         )
         return (
-            finv(
-                torch.tensordot(
-                    self.Ainv.to(device=color.device), color, dims=1
-                )
-            )
+            finv(torch.tensordot(_matrices(color.device)[1], color, dims=1))
             * illuminant_xyz
         )
+
+
+@lru_cache(maxsize=None)
+def _matrices(device: torch.device) -> tuple[Tensor, Tensor]:
+    """
+    `CIELAB.A` and `CIELAB.Ainv` on `device`
+    """
+    return CIELAB.A.to(device=device), CIELAB.Ainv.to(device=device)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 import torch
 from torch import Tensor
 import warnings
@@ -21,14 +22,23 @@ LIN_RGB_MATRIX_INV = torch.tensor(
 )
 
 
+@lru_cache(maxsize=None)
+def _matrices(device: torch.device) -> tuple[Tensor, Tensor]:
+    """
+    `LIN_RGB_MATRIX` and `LIN_RGB_MATRIX_INV` on `device`
+    """
+    return (
+        LIN_RGB_MATRIX.to(device=device),
+        LIN_RGB_MATRIX_INV.to(device=device),
+    )
+
+
 class linRGB:
     def __init__(self, illuminant_xyz: Tensor | None = None):
         assert illuminant_xyz is None
 
     def from_XYZ(self, color: Tensor) -> Tensor:
-        return torch.tensordot(
-            LIN_RGB_MATRIX.to(device=color.device), color, 1
-        )
+        return torch.tensordot(_matrices(color.device)[0], color, 1)
 
     def from_sRGB(self, color: Tensor) -> Tensor:
         if color.min() < 0 or color.max() > 1:
@@ -44,6 +54,4 @@ class linRGB:
         return color
 
     def to_XYZ(self, color: Tensor) -> Tensor:
-        return torch.tensordot(
-            LIN_RGB_MATRIX_INV.to(device=color.device), color, 1
-        )
+        return torch.tensordot(_matrices(color.device)[1], color, 1)
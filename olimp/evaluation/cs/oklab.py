@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 import torch
 from torch import Tensor
 
@@ -40,21 +41,29 @@ LMS_TO_LAB_INV = torch.tensor(
 )
 
 
+@lru_cache(maxsize=None)
+def _matrices(device: torch.device) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+    """
+    `XYZ_TO_LMS`, `LMS_TO_LAB`, `XYZ_TO_LMS_INV` and `LMS_TO_LAB_INV`
+    on `device`
+    """
+    return (
+        XYZ_TO_LMS.to(device=device),
+        LMS_TO_LAB.to(device=device),
+        XYZ_TO_LMS_INV.to(device=device),
+        LMS_TO_LAB_INV.to(device=device),
+    )
+
+
 class Oklab:
     def from_XYZ(self, color: Tensor) -> Tensor:
-        lms = torch.tensordot(
-            XYZ_TO_LMS.to(device=color.device), color, dims=1
-        )
+        xyz_to_lms, lms_to_lab, _, _ = _matrices(color.device)
+        lms = torch.tensordot(xyz_to_lms, color, dims=1)
         lms_cubic_root = torch.pow(lms.clip(min=0.0), 1 / 3)
-        return torch.tensordot(
-            LMS_TO_LAB.to(device=color.device), lms_cubic_root, dims=1
-        )
+        return torch.tensordot(lms_to_lab, lms_cubic_root, dims=1)
 
     def to_XYZ(self, color: Tensor) -> Tensor:
-        lab = torch.tensordot(
-            LMS_TO_LAB_INV.to(device=color.device), color, dims=1
-        )
+        _, _, xyz_to_lms_inv, lms_to_lab_inv = _matrices(color.device)
+        lab = torch.tensordot(lms_to_lab_inv, color, dims=1)
         lab_cube = torch.pow(lab, 3.0)
-        return torch.tensordot(
-            XYZ_TO_LMS_INV.to(device=color.device), lab_cube, dims=1
-        )
+        return torch.tensordot(xyz_to_lms_inv, lab_cube, dims=1)
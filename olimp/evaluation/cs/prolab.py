@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from torch import Tensor
 import torch
 
@@ -33,18 +34,27 @@ class ProLab:
             -1, *((1,) * (color.dim() - 1))
         ).to(device=color.device)
         color_ = color / illuminant_xyz
-        return (
-            torch.tensordot(self.Q.to(device=color.device), color_, dims=1)
-        ) / (
-            torch.tensordot(self.q.to(device=color.device), color_, dims=1)
-            + 1.0
+        q, Q, _ = _matrices(color.device)
+        return torch.tensordot(Q, color_, dims=1) / (
+            torch.tensordot(q, color_, dims=1) + 1.0
         )
 
     def to_XYZ(self, color: Tensor) -> Tensor:
-        y2 = torch.tensordot(self.Q_inv, color, dims=1)
-        xyz = y2 / (
-            1.0 - torch.tensordot(self.q.to(device=color.device), y2, dims=1)
-        )
+        q, _, Q_inv = _matrices(color.device)
+        y2 = torch.tensordot(Q_inv, color, dims=1)
+        xyz = y2 / (1.0 - torch.tensordot(q, y2, dims=1))
         return xyz * self._illuminant_xyz.view(
             -1, *((1,) * (color.dim() - 1))
         ).to(device=color.device)
+
+
+@lru_cache(maxsize=None)
+def _matrices(device: torch.device) -> tuple[Tensor, Tensor, Tensor]:
+    """
+    `ProLab.q`, `ProLab.Q` and `ProLab.Q_inv` on `device`
+    """
+    return (
+        ProLab.q.to(device=device),
+        ProLab.Q.to(device=device),
+        ProLab.Q_inv.to(device=device),
+    )
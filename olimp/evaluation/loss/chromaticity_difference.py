@@ -4,22 +4,20 @@ import torch
 from torch import Tensor
 
 from ._base import ReducibleLoss, Reduction
-from ..cs import D65 as D65_sRGB
-from ..cs.srgb import sRGB
-from ..cs.cielab import CIELAB
-from ..cs.prolab import ProLab as ProLabCS
+from ..cs import srgb2lab, srgb2prolab
 
 
 def _srgb2lab_chromaticity(srgb: Tensor) -> Tensor:
-    lab = CIELAB(D65_sRGB).from_XYZ(sRGB().to_XYZ(srgb))
+    lab = srgb2lab(srgb)
     lab_chromaticity = lab[1:3, :, :]
     return lab_chromaticity
 
 
 def _srgb2prolab_chromaticity(srgb: Tensor) -> Tensor:
-    prolab = ProLabCS(D65_sRGB).from_XYZ(sRGB().to_XYZ(srgb))
-    prolab[0, :, :][prolab[0, :, :] == 0] = 1.0
-    prolab_chromaticity = prolab[1:3, :, :] / prolab[0, :, :]
+    prolab = srgb2prolab(srgb)
+    # treat zero lightness as one, without an in-place masked write
+    lightness = torch.where(prolab[0] == 0, 1.0, prolab[0])
+    prolab_chromaticity = prolab[1:3, :, :] / lightness
     return prolab_chromaticity
 
 
@@ -42,6 +40,10 @@ class ChromaticityDifference(ReducibleLoss):
         img1: Tensor,
         img2: Tensor,
     ) -> Tensor:
+        """
+        Accepts channel first images with any number of leading dimensions
+        between channels and (H, W), returns mean over (H, W)
+        """
         assert img1.shape[0] == 3, img1.shape
         assert img2.shape[0] == 3, img2.shape
 
@@ -49,5 +51,16 @@ class ChromaticityDifference(ReducibleLoss):
         chromaticity2 = self._chromaticity(img2)
 
         return torch.mean(
-            torch.linalg.norm(chromaticity1 - chromaticity2, dim=0)
+            torch.linalg.norm(chromaticity1 - chromaticity2, dim=0),
+            dim=(-2, -1),
+        )
+
+    def forward(self, x: Tensor, y: Tensor) -> Tensor:
+        """
+        Unlike the base class, process the whole batch at once
+        """
+        assert x.ndim == 4, x.shape
+        assert y.ndim == 4, y.shape
+        return self._reduction(
+            self._loss(x.transpose(0, 1), y.transpose(0, 1))
         )
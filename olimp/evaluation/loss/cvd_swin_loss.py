@@ -3,9 +3,7 @@ import torch
 from torch import Tensor
 
 import torchvision.transforms as transforms
-from ..cs import D65 as D65_sRGB
-from ..cs.cielab import CIELAB
-from ..cs.srgb import sRGB
+from ..cs import srgb2lab
 from .ssim import ContrastLoss, SSIMLoss
 
 from olimp.simulate import ApplyDistortion
@@ -14,26 +12,23 @@ from olimp.simulate import ApplyDistortion
 def _global_contrast_img_l1(
     img: Tensor, img2: Tensor, points_number: int = 5
 ) -> tuple[Tensor, Tensor]:
-    img = img.permute(0, 2, 3, 1)
-    img2 = img2.permute(0, 2, 3, 1)
-    hight, width = img.shape[1], img.shape[2]
-
-    rand_hight = torch.randint(0, hight, (points_number,))
-    rand_width = torch.randint(0, width, (points_number,))
-
-    rand_hight1 = torch.randint(0, hight, (points_number,))
-    rand_width1 = torch.randint(0, width, (points_number,))
-
-    img_points1 = img[:, rand_hight, rand_width, :]
-    img_points2 = img[:, rand_hight1, rand_width1, :]
-    img1_diff = img_points1 - img_points2
-    img1_diff = torch.sum(torch.abs(img1_diff), 2)
-
-    img2_points1 = img2[:, rand_hight, rand_width, :]
-    img2_points2 = img2[:, rand_hight1, rand_width1, :]
-
-    img2_diff = img2_points1 - img2_points2
-    img2_diff = torch.sum(torch.abs(img2_diff), 2)
+    # sample pairs of pixels on the image device with a single call,
+    # indexing the flattened (B, C, H * W) images
+    img = img.flatten(2)
+    img2 = img2.flatten(2)
+    points = torch.randint(
+        0, img.shape[-1], (2, points_number), device=img.device
+    )
+
+    img_points = img[:, :, points]
+    img1_diff = torch.sum(
+        torch.abs(img_points[:, :, 0] - img_points[:, :, 1]), 1
+    )
+
+    img2_points = img2[:, :, points]
+    img2_diff = torch.sum(
+        torch.abs(img2_points[:, :, 0] - img2_points[:, :, 1]), 1
+    )
 
     return img1_diff, img2_diff
 
@@ -60,10 +55,8 @@ class CVDSwinLoss:
 
     @staticmethod
     def _srgb2lab(srgb: Tensor) -> Tensor:
-        output = []
-        for i in srgb:
-            output.append(CIELAB(D65_sRGB).from_XYZ(sRGB().to_XYZ(i)))
-        return torch.stack(output, dim=0)
+        # color spaces are channel first, convert the whole batch at once
+        return srgb2lab(srgb.transpose(0, 1)).transpose(0, 1)
 
     def __call__(
         self, image: Tensor, precompensated: Tensor, sim_f: ApplyDistortion
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Literal
 from torch.nn import Module
+import torch.nn.functional as F
 import torch
 from torch import Tensor
 
@@ -36,11 +37,12 @@ class NormalizedRootMSE(Module):
 
     @staticmethod
     def _euclidean(x: Tensor) -> Tensor:
-        return torch.sqrt(torch.mean(x**2))
+        return torch.linalg.vector_norm(x) / x.numel() ** 0.5
 
     @staticmethod
     def _min_max(x: Tensor) -> Tensor:
-        return x.max() - x.min()
+        black, white = torch.aminmax(x)
+        return white - black
 
     @staticmethod
     def _mean(x: Tensor) -> Tensor:
@@ -58,17 +60,22 @@ class NormalizedRootMSE(Module):
             Tensor: The computed NRMSE value. If invert is True, returns `1 - NRMSE`.
         """
         # Compute MSE
-        mse_value = torch.mean((x - y) ** 2)
+        mse_value = F.mse_loss(x, y)
 
         # Compute normalization denominator
         denom = self._denom_function(x)
 
-        # Avoid division by zero
-        if denom == 0:
-            if mse_value == 0.0:
-                return denom
-            raise ValueError("Denominator for normalization is zero.")
+        # Identical images with zero denominator are a perfect match.
+        # Select on device, as `if denom == 0` would sync with the host.
+        # `torch.where` differentiates both branches, so the unused one
+        # gets safe operands to keep NaN out of the gradient
+        perfect = (denom == 0) & (mse_value == 0)
+        mse_value = torch.where(perfect, 1.0, mse_value)
+        safe_denom = torch.where(perfect, 1.0, denom)
 
         # Compute NRMSE
-        nrmse_value = torch.sqrt(mse_value) / denom
-        return 1 - nrmse_value if self.invert else nrmse_value
+        nrmse_value = torch.sqrt(mse_value) / safe_denom
+        if self.invert:
+            nrmse_value = 1 - nrmse_value
+
+        return torch.where(perfect, denom, nrmse_value)
@@ -1,3 +1,10 @@
+from __future__ import annotations
+from importlib import import_module
+
+import torch
+import torch.nn.functional as F
+from torch import Tensor
+
 # Import all relevant classes from piq
 from piq import (
     SSIMLoss,
@@ -55,3 +62,65 @@ __all__ = [
     "InformationWeightedSSIMLoss",
     "CLIPIQA",
 ]
+
+
+def _separable_ssim_per_channel(
+    x: Tensor,
+    y: Tensor,
+    kernel: Tensor,
+    data_range: float = 1.0,
+    k1: float = 0.01,
+    k2: float = 0.03,
+) -> tuple[Tensor, Tensor]:
+    """
+    Same as `piq.ssim._ssim_per_channel`, but filters with the gaussian
+    `kernel` as a row pass and a column pass
+
+    The (C, 1, K, K) gaussian is an outer product of a normalized 1D
+    gaussian with itself, so its column and row sums are the 1D kernels
+    """
+    if x.size(-1) < kernel.size(-1) or x.size(-2) < kernel.size(-2):
+        raise ValueError(
+            f"Kernel size can't be greater than actual input size. "
+            f"Input size: {x.size()}. Kernel size: {kernel.size()}"
+        )
+
+    c1 = k1**2
+    c2 = k2**2
+    kernel_h = kernel[:1].sum(dim=-2, keepdim=True)
+    kernel_v = kernel[:1].sum(dim=-1, keepdim=True)
+
+    # means and second moments of every channel with two convolutions
+    stacked = torch.cat((x, y, x * x, y * y, x * y), dim=1)
+    groups = stacked.size(1)
+    filtered = F.conv2d(
+        stacked, kernel_h.expand(groups, -1, -1, -1), groups=groups
+    )
+    filtered = F.conv2d(
+        filtered, kernel_v.expand(groups, -1, -1, -1), groups=groups
+    )
+    mu_x, mu_y, ex_xx, ex_yy, ex_xy = filtered.split(x.size(1), dim=1)
+
+    mu_xx = mu_x**2
+    mu_yy = mu_y**2
+    mu_xy = mu_x * mu_y
+
+    sigma_xx = ex_xx - mu_xx
+    sigma_yy = ex_yy - mu_yy
+    sigma_xy = ex_xy - mu_xy
+
+    # Contrast sensitivity (CS) with alpha = beta = gamma = 1.
+    cs = (2.0 * sigma_xy + c2) / (sigma_xx + sigma_yy + c2)
+
+    # Structural similarity (SSIM)
+    ss = (2.0 * mu_xy + c1) / (mu_xx + mu_yy + c1) * cs
+
+    return ss.mean(dim=(-1, -2)), cs.mean(dim=(-1, -2))
+
+
+# `SSIMLoss` and `MultiScaleSSIMLoss` always pass a gaussian kernel.
+# `piq.ssim` is shadowed by the function of the same name, hence import_module
+# the original is kept for comparison in tests
+_piq_ssim_per_channel = import_module("piq.ssim")._ssim_per_channel
+for _module in ("piq.ssim", "piq.ms_ssim"):
+    import_module(_module)._ssim_per_channel = _separable_ssim_per_channel
@@ -6,10 +6,7 @@ from torch import Tensor
 from torch.nn import Module
 
 from ._base import ReducibleLoss, Reduction
-from ..cs import D65 as D65_sRGB
-from ..cs.srgb import sRGB
-from ..cs.cielab import CIELAB
-from ..cs.prolab import ProLab
+from ..cs import srgb2lab, srgb2prolab
 
 
 def generate_random_neighbors(
@@ -18,58 +15,62 @@ def generate_random_neighbors(
     n_pixel_neighbors: int = 1000,
     step: int = 10,
     sigma_rate: float = 0.25,
+    generator: torch.Generator | None = None,
 ) -> Tensor:
+    """
+    When `generator` is not provided, a generator seeded from the images
+    is used, so a pair of images always gets the same neighbors. Passing
+    a generator avoids the device -> host synchronization of the seed.
+    """
     _channels, height, width = img1.shape
     dst_height, dst_width = height // step, width // step
 
-    sigma = torch.tensor([height * sigma_rate, width * sigma_rate])
+    if generator is None:
+        seed = hash(torch.mean(img1 + img2).item())
+        generator = torch.Generator(device=img1.device).manual_seed(seed)
+    # the generator decides the device, not the ambient default device
+    device = generator.device
+
+    sigma = torch.tensor(
+        [height * sigma_rate, width * sigma_rate], device=device
+    )
 
     # Create a grid of indices using meshgrid
-    y_indices = torch.arange(0, dst_height) * step
-    x_indices = torch.arange(0, dst_width) * step
+    y_indices = torch.arange(0, dst_height, device=device) * step
+    x_indices = torch.arange(0, dst_width, device=device) * step
     indices = torch.stack(
         torch.meshgrid(y_indices, x_indices, indexing="ij"), dim=-1
     )
 
-    seed = hash(torch.mean(img1 + img2).item())
-    rng = torch.Generator(device=img1.device).manual_seed(seed)
-
-    neighbors = torch.empty(
-        (dst_height, dst_width, 2, n_pixel_neighbors), dtype=torch.float32
-    )
-
-    torch.normal(
-        indices.unsqueeze(-1).repeat(1, 1, 1, n_pixel_neighbors),
-        sigma.unsqueeze(-1).repeat(1, 1, 1, n_pixel_neighbors),
-        generator=rng,
-        out=neighbors,
+    # broadcast mean and sigma instead of repeating them for each neighbor
+    neighbors = torch.randn(
+        (dst_height, dst_width, 2, n_pixel_neighbors),
+        generator=generator,
+        dtype=torch.float32,
+        device=device,
     )
-    return neighbors.round().clamp(min=0).long()
+    neighbors.mul_(sigma.view(1, 1, 2, 1)).add_(indices.unsqueeze(-1))
+    return neighbors.round().clamp(min=0).long().to(device=img1.device)
 
 
 def projective_transformation(points: Tensor, proj_matrix: Tensor) -> Tensor:
     cartesian_index = proj_matrix.shape[0] - 1
-    points_homog = torch.cat(
-        (points, torch.ones(points.shape[0], 1, device=points.device)), dim=1
+    # split into linear part and translation instead of appending ones
+    proj_points_homog = torch.addmm(
+        proj_matrix[:, -1], points, proj_matrix[:, :-1].T
     )
-    proj_points_homog = points_homog @ proj_matrix.T
-    projection = proj_points_homog / proj_points_homog[:, cartesian_index:]
-    projection = projection[:, :cartesian_index]
-    return projection
-
-
-def srgb2prolab(srgb: Tensor) -> Tensor:
-    return ProLab(D65_sRGB).from_XYZ(sRGB().to_XYZ(srgb))
-
-
-def srgb2lab(srgb: Tensor) -> Tensor:
-    return CIELAB(D65_sRGB).from_XYZ(sRGB().to_XYZ(srgb))
+    w = proj_points_homog[:, cartesian_index:]
+    return proj_points_homog[:, :cartesian_index] / w
 
 
 def pixel_contrasts(
     image: Tensor, cy: Tensor, cx: Tensor, ny: Tensor, nx: Tensor
 ) -> Tensor:
-    return torch.norm(image[:, cy, cx] - image[:, ny, nx], dim=0)
+    # `vector_norm` is a fused reduction, unlike the generic `torch.norm`,
+    # and keeps a zero gradient where the neighbor hits the center pixel
+    return torch.linalg.vector_norm(
+        image[:, ny, nx].sub_(image[:, cy, cx]), dim=0
+    )
 
 
 def RMS_map(
@@ -79,43 +80,69 @@ def RMS_map(
     n_pixel_neighbors: int = 1000,
     step: int = 10,
     sigma_rate: float = 0.25,
+    generator: torch.Generator | None = None,
 ) -> Tensor:
-    _channels, height, width = img1.shape
+    """
+    Accepts (C, H, W) images or (B, C, H, W) batches
+    """
+    if img1.ndim == 3:
+        return RMS_map(
+            img1[None],
+            img2[None],
+            color_space,
+            n_pixel_neighbors,
+            step,
+            sigma_rate,
+            generator,
+        )[0]
+    batch_size, _channels, height, width = img1.shape
     dst_height, dst_width = height // step, width // step
 
-    neighbors = generate_random_neighbors(
-        img1, img2, n_pixel_neighbors, step, sigma_rate
+    neighbors = torch.stack(
+        [
+            generate_random_neighbors(
+                image1, image2, n_pixel_neighbors, step, sigma_rate, generator
+            )
+            for image1, image2 in zip(img1, img2)
+        ]
     )
 
     # calculate rms
+    # color spaces are channel first, and images of the batch are stacked
+    # vertically, so that one gather serves the whole batch
     if color_space == "lab":
-        lab1 = srgb2lab(img1)
-        lab2 = srgb2lab(img2)
+        lab1 = srgb2lab(img1.transpose(0, 1)).flatten(1, 2)
+        lab2 = srgb2lab(img2.transpose(0, 1)).flatten(1, 2)
 
     elif color_space == "prolab":
-        lab1 = srgb2prolab(img1)
-        lab2 = srgb2prolab(img2)
+        lab1 = srgb2prolab(img1.transpose(0, 1)).flatten(1, 2)
+        lab2 = srgb2prolab(img2.transpose(0, 1)).flatten(1, 2)
 
     valid_mask = (
-        (0 <= neighbors[:, :, 0, :])
-        & (neighbors[:, :, 0, :] < height)
-        & (0 <= neighbors[:, :, 1, :])
-        & (neighbors[:, :, 1, :] < width)
+        (0 <= neighbors[..., 0, :])
+        & (neighbors[..., 0, :] < height)
+        & (0 <= neighbors[..., 1, :])
+        & (neighbors[..., 1, :] < width)
     )
 
-    ny = neighbors[:, :, 0, :].clamp(0, height - 1)
-    nx = neighbors[:, :, 1, :].clamp(0, width - 1)
+    device = img1.device
+    offset = (torch.arange(0, batch_size, device=device) * height).view(
+        -1, 1, 1, 1
+    )
+    ny = neighbors[..., 0, :].clamp(0, height - 1) + offset
+    nx = neighbors[..., 1, :].clamp(0, width - 1)
 
-    y_indices = torch.arange(0, dst_height) * step
-    x_indices = torch.arange(0, dst_width) * step
-    grid_y, grid_x = torch.meshgrid(y_indices, x_indices, indexing="ij")
-    cy = grid_y.unsqueeze(-1).expand(-1, -1, n_pixel_neighbors)
-    cx = grid_x.unsqueeze(-1).expand(-1, -1, n_pixel_neighbors)
+    # (B, dst_height, 1, 1) and (1, dst_width, 1) broadcast against the
+    # neighbors, so each center pixel is gathered once, not per neighbor
+    y_centers = torch.arange(0, dst_height, device=device) * step
+    cy = y_centers[:, None, None] + offset
+    cx = (torch.arange(0, dst_width, device=device) * step)[None, :, None]
 
     image1_contrast = pixel_contrasts(lab1, cy, cx, ny, nx)
     image2_contrast = pixel_contrasts(lab2, cy, cx, ny, nx)
     contrast_diff = (image1_contrast - image2_contrast) / 1.6
-    mean = (contrast_diff**2 * valid_mask).sum(dim=-1) / valid_mask.sum(dim=-1)
+    n_valid = valid_mask.sum(dim=-1).clamp_min(1)
+    mean = (contrast_diff**2 * valid_mask).sum(dim=-1) / n_valid
     return torch.sqrt(mean)
 
 
@@ -129,21 +156,34 @@ class RMS(ReducibleLoss):
         step: int = 10,
         sigma_rate: float = 0.25,
         reduction: Reduction = "mean",
+        generator: torch.Generator | None = None,
     ) -> None:
         super().__init__(reduction=reduction)
         self._color_space = color_space
         self._n_pixel_neighbors = n_pixel_neighbors
         self._step = step
         self._sigma_rate = sigma_rate
-
-    def _loss(self, img1: Tensor, img2: Tensor):
-        return torch.mean(
-            RMS_map(
-                img1,
-                img2,
-                self._color_space,
-                self._n_pixel_neighbors,
-                self._step,
-                self._sigma_rate,
-            )
+        self._generator = generator
+
+    def _loss(self, x: Tensor, y: Tensor) -> Tensor:
+        """
+        Accepts (C, H, W) images or (B, C, H, W) batches
+        """
+        rms_map = RMS_map(
+            x,
+            y,
+            self._color_space,
+            self._n_pixel_neighbors,
+            self._step,
+            self._sigma_rate,
+            self._generator,
         )
+        return torch.mean(rms_map, dim=(-2, -1))
+
+    def forward(self, x: Tensor, y: Tensor) -> Tensor:
+        """
+        Unlike the base class, process the whole batch at once
+        """
+        assert x.ndim == 4, x.shape
+        assert y.ndim == 4, y.shape
+        return self._reduction(self._loss(x, y))
@@ -4,24 +4,15 @@ import torch
 from torch import Tensor
 from typing import Literal
 
-from ..cs import D65 as D65_sRGB
-from ..cs.srgb import sRGB
-from ..cs.cielab import CIELAB
-from ..cs.prolab import ProLab
+from ..cs import srgb2lab, srgb2prolab, srgb_converter
 from ..cs.oklab import Oklab
 from ._base import ReducibleLoss, Reduction, identity
 
-
-def srgb2prolab(srgb: Tensor) -> Tensor:
-    return ProLab(D65_sRGB).from_XYZ(sRGB().to_XYZ(srgb))
-
-
-def srgb2lab(srgb: Tensor) -> Tensor:
-    return CIELAB(D65_sRGB).from_XYZ(sRGB().to_XYZ(srgb))
+_oklab = Oklab()
 
 
 def srgb2oklab(srgb: Tensor) -> Tensor:
-    return Oklab().from_XYZ(sRGB().to_XYZ(srgb))
+    return _oklab.from_XYZ(srgb_converter.to_XYZ(srgb))
 
 
 class RMSE(ReducibleLoss):
@@ -6,6 +6,9 @@ import torch
 from torch import Tensor
 from ._base import ReducibleLoss, Reduction
 
+_C1 = 0.01**2
+_C2 = 0.03**2
+
 
 class SSIMLoss(ReducibleLoss):
     def __init__(
@@ -26,14 +29,18 @@ class SSIMLoss(ReducibleLoss):
         self.kernel_size = kernel_size
         self.sigma = sigma
         self._invert = invert
-        self.gaussian_kernel = self._create_gaussian_kernel(
-            self.kernel_size, self.sigma
+        # a single channel kernel, expanded to every channel on use.
+        # gaussian is separable, so filter rows and columns separately.
+        # buffers follow the module on `.to(device)`
+        kernel_1d = self._create_gaussian_kernel(self.kernel_size, self.sigma)
+        self.register_buffer("gaussian_kernel_h", kernel_1d, persistent=False)
+        self.register_buffer(
+            "gaussian_kernel_v",
+            kernel_1d.transpose(-1, -2).contiguous(),
+            persistent=False,
         )
 
     def _loss(self, x: Tensor, y: Tensor) -> Tensor:
-        if not self.gaussian_kernel.is_cuda:
-            self.gaussian_kernel = self.gaussian_kernel.to(x.device)
-
         ssim_map = self._ssim(x, y)
 
         if self._invert:
@@ -42,41 +49,37 @@ class SSIMLoss(ReducibleLoss):
             return ssim_map.mean()
 
     def _ssim(self, x: Tensor, y: Tensor) -> Tensor:
-        # Compute means
-        ux = F.conv2d(
-            x, self.gaussian_kernel, padding=self.kernel_size // 2, groups=3
+        # Filter the means and second moments with one separable gaussian pass
+        stacked = torch.cat((x, y, x * x, y * y, x * y), dim=-3)
+        groups = stacked.shape[-3]
+        pad = self.kernel_size // 2
+        # depthwise convolution is much faster than filtering every channel
+        # as a separate image, and `expand` doesn't copy the kernel
+        filtered = F.conv2d(
+            stacked,
+            self.gaussian_kernel_h.expand(groups, -1, -1, -1),
+            padding=(0, pad),
+            groups=groups,
         )
-        uy = F.conv2d(
-            y, self.gaussian_kernel, padding=self.kernel_size // 2, groups=3
+        filtered = F.conv2d(
+            filtered,
+            self.gaussian_kernel_v.expand(groups, -1, -1, -1),
+            padding=(pad, 0),
+            groups=groups,
         )
+        ux, uy, uxx, uyy, uxy = filtered.split(x.shape[-3], dim=-3)
 
         # Compute variances
-        uxx = F.conv2d(
-            x * x,
-            self.gaussian_kernel,
-            padding=self.kernel_size // 2,
-            groups=3,
-        )
-        uyy = F.conv2d(
-            y * y,
-            self.gaussian_kernel,
-            padding=self.kernel_size // 2,
-            groups=3,
-        )
-        uxy = F.conv2d(
-            x * y,
-            self.gaussian_kernel,
-            padding=self.kernel_size // 2,
-            groups=3,
-        )
-        vx = uxx - ux * ux
-        vy = uyy - uy * uy
-        vxy = uxy - ux * uy
-
-        c1 = 0.01**2
-        c2 = 0.03**2
-        numerator = (2 * ux * uy + c1) * (2 * vxy + c2)
-        denominator = (ux**2 + uy**2 + c1) * (vx + vy + c2)
+        ux_uy = ux * uy
+        ux_sq = ux.square()
+        uy_sq = uy.square()
+        vx = uxx - ux_sq
+        vy = uyy - uy_sq
+        vxy = uxy - ux_uy
+
+        # intermediates above are not saved for backward, reuse them in-place
+        numerator = ux_uy.mul_(2).add_(_C1) * vxy.mul_(2).add_(_C2)
+        denominator = ux_sq.add_(uy_sq).add_(_C1) * vx.add_(vy).add_(_C2)
         return numerator / denominator
 
     def _create_gaussian_kernel(
@@ -86,62 +89,37 @@ class SSIMLoss(ReducibleLoss):
         end = (1 + kernel_size) / 2
         kernel_1d = torch.arange(start, end, step=1, dtype=torch.float)
         kernel_1d = torch.exp(-torch.pow(kernel_1d / sigma, 2) / 2)
-        kernel_1d = (kernel_1d / kernel_1d.sum()).unsqueeze(dim=0)
-
-        kernel_2d = torch.matmul(kernel_1d.t(), kernel_1d)
-        kernel_2d = kernel_2d.expand(
-            3, 1, kernel_size, kernel_size
-        ).contiguous()
-        return kernel_2d
+        kernel_1d = kernel_1d / kernel_1d.sum()
+        return kernel_1d.view(1, 1, 1, kernel_size)
 
 
 class ContrastLoss(Module):
     @staticmethod
     def calculate_contrast_oneimg_l1(img: Tensor, window_size: int) -> Tensor:
-        img = img.permute(0, 2, 3, 1)
-        x_diff = img[
-            :, window_size : 256 - window_size, window_size : 256 - window_size
-        ]
-        x = x_diff
-        flag = 0
-        for i in range(-window_size, window_size + 1):
-            for j in range(-window_size, window_size + 1):
-                if (i == -window_size) and (j == -window_size):
-                    img_diff = (
-                        x_diff
-                        - img[
-                            :,
-                            window_size + i : 256 - window_size + i,
-                            window_size + j : 256 - window_size + j,
-                        ]
-                    )
-                    img_diff = torch.sum(torch.abs(img_diff), 3)
-                    img_diff = torch.unsqueeze(img_diff, 3)
-                    x = img_diff
-                    flag += 1
-                elif (i == 0) and (j == 0):
-                    continue
-                else:
-                    flag += 1
-                    img_diff = (
-                        x_diff
-                        - img[
-                            :,
-                            window_size + i : 256 - window_size + i,
-                            window_size + j : 256 - window_size + j,
-                        ]
-                    )
-                    img_diff = torch.sum(torch.abs(img_diff), 3)
-                    img_diff = torch.unsqueeze(img_diff, 3)
-                    x = torch.cat((x, img_diff), 3)
-        # exit()
-        # nrand = np.array([i for i in range(120)])
-        # np.random.shuffle(nrand)
-        # nrand = nrand[0:60]
-        # trand = torch.from_numpy(nrand).type(torch.long)
-        # trand = torch.arange(120)
-        # trand = torch.randint(0, 120, (60,))
-        return torch.abs(x[:, :, :, :120])
+        """
+        L1 distances between each pixel and its neighbors inside the window,
+        returned as (B, H - 2 * window_size, W - 2 * window_size, neighbors)
+        """
+        batch_size, channels, height, width = img.shape
+        kernel_size = 2 * window_size + 1
+        # all windows at once (B, C, kernel_size², L)
+        patches = F.unfold(img, kernel_size=kernel_size).view(
+            batch_size, channels, kernel_size * kernel_size, -1
+        )
+        center = kernel_size * kernel_size // 2
+        img_diff = torch.sum(
+            torch.abs(patches - patches[:, :, center : center + 1]), dim=1
+        )
+        img_diff = torch.cat(
+            (img_diff[:, :center], img_diff[:, center + 1 :]), dim=1
+        )
+        x = img_diff.view(
+            batch_size,
+            -1,
+            height - 2 * window_size,
+            width - 2 * window_size,
+        ).permute(0, 2, 3, 1)
+        return x[:, :, :, :120]
 
     def forward(self, image: Tensor, precompensated: Tensor) -> Tensor:
         criterion_contrast = L1Loss()
@@ -45,7 +45,7 @@ def _demo():
     ) -> torch.Tensor:
         ret = feng_xu(image, psf, lambda_val=2)
         progress(0.8)
-        ret = fft_conv(scale_value(ret), psf)
+        ret = fft_conv(scale_value(ret, inplace=True), psf)
         progress(1.0)
         return ret
 
@@ -49,7 +49,7 @@ def _demo():
     ) -> torch.Tensor:
         ret = huang(image, psf)
         progress(1.0)
-        return scale_value(ret, min_val=0, max_val=1.0)
+        return scale_value(ret, min_val=0, max_val=1.0, inplace=True)
 
     demo("Huang", demo_huang, mono=False)
 
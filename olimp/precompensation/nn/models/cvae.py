@@ -4,7 +4,7 @@ import torch
 import torch.nn as nn
 from torch import Tensor
 from olimp.processing import fft_conv
-from .download_path import download_path, PyOlimpHF
+from .download_path import load_state_dict, PyOlimpHF
 
 # import torch.nn.functional as F
 
@@ -108,10 +108,7 @@ class CVAE(nn.Module):
     @classmethod
     def from_path(cls, path: PyOlimpHF):
         model = cls()
-        path = download_path(path)
-        state_dict = torch.load(
-            path, map_location=torch.get_default_device(), weights_only=True
-        )
+        state_dict = load_state_dict(path)
         model.load_state_dict(state_dict)
         return model
 
@@ -10,7 +10,7 @@ import torch
 import torch.nn as nn
 import torchvision.transforms as transforms
 from timm.models.layers import trunc_normal_
-from ..download_path import download_path, PyOlimpHF
+from ..download_path import load_state_dict, PyOlimpHF
 
 
 class Generator_transformer_pathch2(nn.Module):
@@ -273,12 +273,7 @@ class Generator_transformer_pathch2(nn.Module):
         cls,
         path: PyOlimpHF = "hf://CVD/cvd_swin.pth",
     ):
-        path = download_path(path)
-        state_dict = torch.load(
-            path,
-            map_location=torch.get_default_device(),
-            weights_only=True,
-        )
+        state_dict = load_state_dict(path)
         new_state_dict = {}
         for key, value in state_dict.items():
             new_key = key.replace("module.", "")
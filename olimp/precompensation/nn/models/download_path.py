@@ -1,5 +1,10 @@
 from __future__ import annotations
 from typing import Literal
+from functools import lru_cache
+import os
+from zipfile import is_zipfile
+import torch
+from torch import Tensor
 
 PyOlimpHF = (
     Literal[
@@ -36,3 +41,35 @@ def download_path(path: PyOlimpHF) -> str:
         from os.path import expanduser
 
         return expanduser(path)
+
+
+@lru_cache(maxsize=8)
+def _load_state_dict(
+    path: str, version: tuple[int, int] | None
+) -> dict[str, Tensor]:
+    local_path = download_path(path)
+    # Only hub files are memory-mapped, they are never rewritten in place.
+    # A local checkpoint can be overwritten while the memoized tensors are
+    # still in use, and reading truncated pages kills the process with
+    # SIGBUS. Checkpoints in the legacy (pre zip) format can't be mapped
+    mmap = path.startswith("hf://") and is_zipfile(local_path)
+    return torch.load(
+        local_path, map_location="cpu", weights_only=True, mmap=mmap
+    )
+
+
+def load_state_dict(path: PyOlimpHF) -> dict[str, Tensor]:
+    """
+    Loads state dict on CPU (memory-mapped for "hf://" paths),
+    `nn.Module.load_state_dict` copies the weights to the device of the
+    model. Checkpoints are memoized, so instantiating the same model
+    again doesn't read and parse it again. The returned dict is shared,
+    don't modify it
+    """
+    if path.startswith("hf://"):
+        version = None  # hub files don't change under the same name
+    else:
+        # a replaced local checkpoint must be read again
+        stat = os.stat(download_path(path))
+        version = (stat.st_mtime_ns, stat.st_size)
+    return _load_state_dict(path, version)
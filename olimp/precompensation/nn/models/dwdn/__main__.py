@@ -11,8 +11,10 @@ def _demo():
         image: Tensor, psf: Tensor, progress: Callable[[float], None]
     ) -> Tensor:
         model = PrecompensationDWDN.from_path(path="hf://RVI/dwdn.pt")
+        model = model.to(memory_format=torch.channels_last)
 
         with torch.inference_mode():
+            image = image.to(memory_format=torch.channels_last)
             inputs = model.preprocess(image, psf.to(torch.float32))
             progress(0.1)
             (precompensation,) = model(inputs, **model.arguments(inputs, psf))
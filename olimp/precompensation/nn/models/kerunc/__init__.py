@@ -4,7 +4,7 @@ from torch import nn, Tensor
 from typing import Any, TypeAlias, List
 
 from .model import kernel_error_model
-from ..download_path import download_path, PyOlimpHF
+from ..download_path import load_state_dict, PyOlimpHF
 
 Inputs: TypeAlias = tuple[Tensor, Tensor]
 
@@ -44,10 +44,7 @@ class PrecompensationKERUNC(kernel_error_model):
     @classmethod
     def from_path(cls, path: PyOlimpHF, **kwargs: Any):
         model = cls(**kwargs)
-        path = download_path(path)
-        state_dict = torch.load(
-            path, map_location=torch.get_default_device(), weights_only=True
-        )
+        state_dict = load_state_dict(path)
         model.load_state_dict(state_dict)
         return model
 
@@ -5,7 +5,7 @@ import segmentation_models_pytorch as smp
 
 # import torchvision
 from olimp.processing import fft_conv
-from .download_path import download_path, PyOlimpHF
+from .download_path import load_state_dict, PyOlimpHF
 
 
 class PrecompensationUNETB0(smp.Unet):
@@ -33,11 +33,7 @@ class PrecompensationUNETB0(smp.Unet):
     @classmethod
     def from_path(cls, path: PyOlimpHF, **kwargs):
         model = cls(**kwargs)
-        path = download_path(path)
-        state_dict = torch.load(
-            path, map_location=torch.get_default_device(), weights_only=True
-        )
-        model.load_state_dict(state_dict)
+        model.load_state_dict(load_state_dict(path))
         return model
 
     def preprocess(self, image: Tensor, psf: Tensor) -> Tensor:
@@ -75,9 +71,11 @@ def _demo():
         model = PrecompensationUNETB0.from_path(
             "hf://RVI/unet-efficientnet-b0.pth"
         )
+        model = model.to(memory_format=torch.channels_last)
         with torch.inference_mode():
             psf = psf.to(torch.float32)
             inputs = model.preprocess(image, psf)
+            inputs = inputs.to(memory_format=torch.channels_last)
             progress(0.1)
             (precompensation,) = model(inputs)
             progress(1.0)
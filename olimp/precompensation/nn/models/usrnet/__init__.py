@@ -3,7 +3,7 @@ from typing import Literal, TypeAlias
 import torch
 from torch import nn, Tensor
 from .model import USRNet
-from ..download_path import download_path, PyOlimpHF
+from ..download_path import load_state_dict, PyOlimpHF
 
 Input: TypeAlias = tuple[Tensor, Tensor, int, Tensor]
 
@@ -85,10 +85,7 @@ class PrecompensationUSRNet(USRNet):
     @classmethod
     def from_path(cls, path: PyOlimpHF, **kwargs):
         model = cls(**kwargs)
-        path = download_path(path)
-        state_dict = torch.load(
-            path, map_location=torch.get_default_device(), weights_only=True
-        )
+        state_dict = load_state_dict(path)
         new_state_dict = {}
         for key, value in state_dict.items():
             new_key = key.replace("module.", "")
@@ -5,7 +5,7 @@ from torch import Tensor
 
 # import torchvision
 from olimp.processing import fft_conv
-from .download_path import download_path, PyOlimpHF
+from .download_path import load_state_dict, PyOlimpHF
 
 
 class VAE(nn.Module):
@@ -20,17 +20,17 @@ class VAE(nn.Module):
         # Encoder
         self.encoder = nn.Sequential(
             nn.Conv2d(3, 32, 3, stride=2, padding=1),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.Conv2d(32, 64, 3, stride=2, padding=1),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.Conv2d(64, 128, 3, stride=2, padding=1),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.Conv2d(128, 256, 3, stride=2, padding=1),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.Conv2d(256, 512, 3, stride=2, padding=1),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.Conv2d(512, 1024, 3, stride=2, padding=1),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
         )
 
         # Assuming input image size is 512x512
@@ -44,23 +44,23 @@ class VAE(nn.Module):
             nn.ConvTranspose2d(
                 1024, 512, 3, stride=2, padding=1, output_padding=1
             ),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.ConvTranspose2d(
                 512, 256, 3, stride=2, padding=1, output_padding=1
             ),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.ConvTranspose2d(
                 256, 128, 3, stride=2, padding=1, output_padding=1
             ),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.ConvTranspose2d(
                 128, 64, 3, stride=2, padding=1, output_padding=1
             ),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.ConvTranspose2d(
                 64, 32, 3, stride=2, padding=1, output_padding=1
             ),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.ConvTranspose2d(
                 32, 1, 3, stride=2, padding=1, output_padding=1
             ),
@@ -70,11 +70,7 @@ class VAE(nn.Module):
     @classmethod
     def from_path(cls, path: PyOlimpHF):
         model = cls()
-        path = download_path(path)
-        state_dict = torch.load(
-            path, map_location=torch.get_default_device(), weights_only=True
-        )
-        model.load_state_dict(state_dict)
+        model.load_state_dict(load_state_dict(path))
         return model
 
     def reparameterize(self, mu: nn.Linear, logvar: nn.Linear):
@@ -84,7 +80,7 @@ class VAE(nn.Module):
 
     def forward(self, x: Tensor):
         encoded = self.encoder(x)
-        encoded = encoded.view(encoded.size(0), -1)
+        encoded = torch.flatten(encoded, 1)  # also for channels_last input
 
         mu = self.fc_mu(encoded)
         logvar = self.fc_logvar(encoded)
@@ -127,9 +123,11 @@ def _demo():
         progress: Callable[[float], None],
     ) -> Tensor:
         model = VAE.from_path("hf://RVI/vae.pth")
+        model = model.to(memory_format=torch.channels_last)
         with torch.inference_mode():
             psf = psf.to(torch.float32)
             inputs = model.preprocess(image, psf)
+            inputs = inputs.to(memory_format=torch.channels_last)
             progress(0.1)
             precompensation, _mu, _logvar = model(inputs)
             progress(1.0)
@@ -5,7 +5,7 @@ from torch import Tensor
 
 # import torchvision
 from olimp.processing import fft_conv
-from .download_path import download_path, PyOlimpHF
+from .download_path import load_state_dict, PyOlimpHF
 
 
 class _ConvReLU(nn.Module):
@@ -50,10 +50,7 @@ class VDSR(nn.Module):
     @classmethod
     def from_path(cls, path: PyOlimpHF):
         model = cls()
-        path = download_path(path)
-        state_dict = torch.load(
-            path, map_location=torch.get_default_device(), weights_only=True
-        )
+        state_dict = load_state_dict(path)
         model.load_state_dict(state_dict)
         return model
 
@@ -12,7 +12,7 @@ from .distortion import DistortionConfig
 
 from torch.utils.data import Dataset
 from torch import Tensor
-from .....simulate import Distortion
+from .....simulate import Distortion, ApplyDistortion
 
 
 class DistortionsGroup(NamedTuple):
@@ -30,21 +30,37 @@ class DistortionsGroup(NamedTuple):
 
     def create(self, arguments: Sequence[Tensor]):
         outs_len = len([ds for ds in self.datasets if ds is not None])
+        # `arguments` don't change between calls, check them once
+        assert len(arguments) == outs_len, (len(arguments), outs_len)
+
+        # build the distortions once, the returned function can be
+        # called several times per batch
+        the_distortions: list[ApplyDistortion] = []
+        dataset_idx = 0
+        for distortion, d_input in zip(
+            self.distortions, self.datasets, strict=True
+        ):
+            if d_input is None:  # None = no arguments
+                the_distortions.append(distortion())
+            else:
+                the_distortions.append(distortion(arguments[dataset_idx]))
+                dataset_idx += 1
+
+        if len(the_distortions) == 1:
+            # the common case, skip the generic loop
+            (the_distortion,) = the_distortions
+
+            def apply_single_distortion(original_image: Tensor) -> Tensor:
+                # distortion output is a fresh tensor, clamp it in-place
+                return the_distortion(original_image).clamp_(min=0.0, max=1.0)
+
+            return apply_single_distortion
 
         def apply_distortion(
             original_image: Tensor,
         ) -> Tensor:
-            assert len(arguments) == outs_len, (len(arguments), outs_len)
-            dataset_idx = 0
-            for distortion, d_input in zip(
-                self.distortions, self.datasets, strict=True
-            ):
-                if d_input is None:  # None = no arguments
-                    the_distortion = distortion()
-                else:
-                    the_distortion = distortion(arguments[dataset_idx])
-                    dataset_idx += 1
-                original_image = the_distortion(original_image).clip(
+            for the_distortion in the_distortions:
+                original_image = the_distortion(original_image).clamp_(
                     min=0.0, max=1.0
                 )
             return original_image
@@ -1,13 +1,31 @@
 from __future__ import annotations
 from typing import Annotated, Literal, Any, TypeAlias, Callable, Union
+from typing import TypeVar
 from collections.abc import Sequence
 from .base import StrictModel
 from pydantic import Field, confloat
 from .....simulate import ApplyDistortion
 from torch import Tensor
 
+_Loss = TypeVar("_Loss", bound=Callable[..., Tensor])
 
-def _create_simple_loss(loss: Callable[[Tensor, Tensor], Tensor]):
+_TORCH_COMPILE_DESCRIPTION = (
+    "Compile the loss with `torch.compile`. "
+    "Faster training steps at the cost of a long first step"
+)
+
+
+def _compile(loss: _Loss, enabled: bool) -> _Loss:
+    if not enabled:
+        return loss
+    import torch
+
+    return torch.compile(loss)  # type: ignore
+
+
+def _create_simple_loss(
+    loss: Callable[[Tensor, Tensor], Tensor], torch_compile: bool = False
+):
     def f(
         precompensated: Tensor,
         original_image: Tensor,
@@ -16,7 +34,9 @@ def _create_simple_loss(loss: Callable[[Tensor, Tensor], Tensor]):
     ) -> Tensor:
         return loss(distortion_fn(precompensated), original_image, *extra)
 
-    return f
+    # compile `f` rather than `loss`, so the distortion's tensor ops
+    # are traced together with the loss
+    return _compile(f, torch_compile)
 
 
 class VaeLossFunction(StrictModel):
@@ -48,15 +68,21 @@ class CVDSwinLossFunction(StrictModel):
     name: Literal["CVDSwinLoss"]
     lambda_ssim: Annotated[float, confloat(ge=0, le=1)] = 0.25
     global_points: int = 3000
+    torch_compile: bool = Field(
+        default=False, description=_TORCH_COMPILE_DESCRIPTION
+    )
 
     def load(self, _model: Any):
         from .....evaluation.loss.cvd_swin_loss import (
             CVDSwinLoss,
         )
 
-        cbl = CVDSwinLoss(
-            lambda_ssim=self.lambda_ssim,
-            global_points=self.global_points,
+        cbl = _compile(
+            CVDSwinLoss(
+                lambda_ssim=self.lambda_ssim,
+                global_points=self.global_points,
+            ),
+            self.torch_compile,
         )
 
         def f(
@@ -160,6 +186,9 @@ class SSIMLossFunction(StrictModel):
     kernel_sigma: float = 1.5
     k1: float = 0.01
     k2: float = 0.03
+    torch_compile: bool = Field(
+        default=False, description=_TORCH_COMPILE_DESCRIPTION
+    )
 
     def load(self, _model: Any):
         from .....evaluation.loss.piq import SSIMLoss
@@ -171,7 +200,7 @@ class SSIMLossFunction(StrictModel):
             k2=self.k2,
         )
 
-        return _create_simple_loss(ssim)
+        return _create_simple_loss(ssim, self.torch_compile)
 
 
 class MultiScaleSSIMLossFunction(StrictModel):
@@ -322,6 +351,7 @@ LossFunction = Annotated[
     VaeLossFunction
     | ChromaticityDifferenceLossFunction
     | CVDSwinLossFunction
+    | SSIMLossFunction
     | MultiScaleSSIMLossFunction
     | RMSLossFunction
     | VSILossFunction,
@@ -31,7 +31,7 @@ import torch.nn.functional as F
 from torchvision.transforms.functional import resize
 from torch import Tensor
 from PIL import Image
-from ....nn.models.download_path import download_path, PyOlimpHF
+from ....nn.models.download_path import load_state_dict, PyOlimpHF
 
 
 def _conv_layer(
@@ -298,10 +298,7 @@ class HDRnetModel(nn.Module):
 
     @classmethod
     def from_path(cls, path: PyOlimpHF):
-        path = download_path(path)
-        state_dict = torch.load(
-            path, map_location=torch.get_default_device(), weights_only=True
-        )
+        state_dict = dict(load_state_dict(path))
         params = state_dict.pop("params")
         # k_list = list(state_dict.keys())
         # for k in k_list:
@@ -1,14 +1,24 @@
 from __future__ import annotations
+from typing import Literal
+from collections.abc import Sequence
 import torch
 import torch.nn.functional as F
 
 
 def resize_kernel(
-    kernel: torch.Tensor, target_size: tuple[int, int]
+    kernel: torch.Tensor,
+    target_size: tuple[int, int],
+    mode: Literal["bilinear", "fft"] = "bilinear",
 ) -> torch.Tensor:
     """
     Rescales kernel to `target_size`
+
+    `mode="fft"` resamples in the frequency domain by zero padding
+    (upscaling) or truncating (downscaling) the spectrum of `kernel`,
+    which does not blur the kernel like bilinear interpolation does
     """
+    if mode == "fft":
+        return _fft_resize(kernel, target_size)
     resized_kernel = F.interpolate(
         kernel, size=target_size, mode="bilinear", align_corners=True
     )
@@ -16,10 +26,53 @@ def resize_kernel(
     return resized_kernel
 
 
-def fft_conv(image: torch.Tensor, kernel: torch.Tensor) -> torch.Tensor:
+def _fft_resize(
+    kernel: torch.Tensor, target_size: tuple[int, int]
+) -> torch.Tensor:
+    # "forward" normalization keeps values, not the sum, like `interpolate`
+    spectrum = torch.fft.fft2(kernel, norm="forward")
+    spectrum = _resize_spectrum(spectrum, -2, target_size[0])
+    spectrum = _resize_spectrum(spectrum, -1, target_size[1])
+    return torch.fft.ifft2(spectrum, norm="forward").real
+
+
+def _resize_spectrum(
+    spectrum: torch.Tensor, dim: int, target: int
+) -> torch.Tensor:
+    size = spectrum.shape[dim]
+    common = min(size, target)
+    n_low, n_high = (common + 1) // 2, common // 2
+    shape = list(spectrum.shape)
+    shape[dim] = target
+    out = spectrum.new_zeros(shape)
+    out.narrow(dim, 0, n_low).copy_(spectrum.narrow(dim, 0, n_low))
+    out.narrow(dim, target - n_high, n_high).copy_(
+        spectrum.narrow(dim, size - n_high, n_high)
+    )
+    if common % 2 == 0 and size != target:
+        # even sizes have a single nyquist frequency, split it between
+        # +/- frequencies when upscaling, and merge them when downscaling
+        nyquist = out.narrow(dim, target - n_high, 1)
+        if target > size:
+            nyquist.mul_(0.5)
+            out.narrow(dim, n_high, 1).copy_(nyquist)
+        else:
+            nyquist.add_(spectrum.narrow(dim, n_high, 1))
+    return out
+
+
+def fft_conv(
+    image: torch.Tensor,
+    kernel: torch.Tensor,
+    precision: Literal["fp32", "fp16"] = "fp32",
+) -> torch.Tensor:
     """
     FFT base method for fast convolution. Input types are expected to be
     `float32` and size must be equal
+
+    `precision="fp16"` computes the spectra in half precision, which is
+    faster on CUDA. Half precision FFT is only available on CUDA and for
+    sizes that are powers of two
     """
     assert image.dtype == torch.float32, image.dtype
     assert kernel.dtype == torch.float32, kernel.dtype
@@ -27,8 +80,48 @@ def fft_conv(image: torch.Tensor, kernel: torch.Tensor) -> torch.Tensor:
         image.shape[-2:] == kernel.shape[-2:]
     ), f"Expected equal shapes, got: image={image.shape[-2:]}, kernel={kernel.shape[-2:]}"
 
-    return torch.real(
-        torch.fft.ifft2(torch.fft.fft2(image) * torch.fft.fft2(kernel))
+    if precision == "fp16":
+        height, width = image.shape[-2:]
+        assert not (height & (height - 1) or width & (width - 1)), (
+            f"Half precision FFT needs power of two sizes, "
+            f"got: {(height, width)}"
+        )
+        # orthonormal image spectrum stays within fp16 range, the
+        # "ortho" inverse completes the usual convolution scaling
+        spectrum = torch.fft.rfft2(image.half(), norm="ortho")
+        spectrum = spectrum * torch.fft.rfft2(kernel.half())
+        return torch.fft.irfft2(
+            spectrum, s=image.shape[-2:], norm="ortho"
+        ).float()
+    return fft_conv_precomputed(
+        image, torch.fft.rfft2(kernel), kernel.shape[-2:]
+    )
+
+
+def fft_conv_precomputed(
+    image: torch.Tensor,
+    kernel_spectrum: torch.Tensor,
+    kernel_size: Sequence[int],
+) -> torch.Tensor:
+    """
+    Same as `fft_conv`, but accepts `torch.fft.rfft2(kernel)`, so that
+    the spectrum of a kernel applied to many images is computed once.
+    `kernel_size` is `kernel.shape[-2:]`, the spectrum alone doesn't tell
+    odd widths from even ones
+    """
+    assert image.dtype == torch.float32, image.dtype
+    assert image.shape[-2:] == tuple(
+        kernel_size
+    ), f"Expected equal shapes, got: image={image.shape[-2:]}, kernel={tuple(kernel_size)}"
+    height, width = kernel_size
+    assert kernel_spectrum.shape[-2:] == (height, width // 2 + 1), (
+        f"Expected spectrum of {(height, width)} kernel, "
+        f"got: {kernel_spectrum.shape[-2:]}"
+    )
+
+    # inputs are real, so half of the spectrum is redundant
+    return torch.fft.irfft2(
+        torch.fft.rfft2(image) * kernel_spectrum, s=image.shape[-2:]
     )
 
 
@@ -36,27 +129,27 @@ def scale_value(
     arr: torch.Tensor,
     min_val: float = 0.0,
     max_val: float = 1.0,
+    *,
+    inplace: bool = False,
 ) -> torch.Tensor:
     """
     Rescale values making minimum equal `min_val` and maximum equal `max_val`
+
+    With `inplace=True` the result is written to `arr`, for callers that
+    don't need the original values
     """
-    black, white = arr.min(), arr.max()
-    if black == white:
-        mul = 0.0
-        if min_val <= black <= max_val:
-            add = black
-        else:
-            add = (
-                min_val
-                if abs(black - min_val) <= abs(black - max_val)
-                else max_val
-            )
-    else:
-        mul = (max_val - min_val) / (white - black)
-        add = -black * mul + min_val
-    out = torch.mul(arr, mul)
-    out += add
-    return out
+    black, white = torch.aminmax(arr)
+    # branchless, so that there is no device -> host synchronization
+    degenerate = black == white
+    span = torch.where(degenerate, 1.0, white - black)
+    mul = torch.where(degenerate, 0.0, (max_val - min_val) / span)
+    # constant image maps to the closest value within [min_val, max_val]
+    add = torch.where(
+        degenerate, black.clamp(min_val, max_val), min_val - black * mul
+    )
+    if inplace:
+        return arr.mul_(mul).add_(add)
+    return torch.addcmul(add, arr, mul)
 
 
 def quantile_clip(image: torch.Tensor, quantile: float = 0.98) -> torch.Tensor:
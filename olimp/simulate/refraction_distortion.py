@@ -1,7 +1,8 @@
 from __future__ import annotations
+import torch
 from torch import Tensor
 from olimp.simulate import ApplyDistortion, Distortion
-from olimp.processing import fft_conv
+from olimp.processing import fft_conv_precomputed
 
 
 class RefractionDistortion(Distortion):
@@ -16,7 +17,12 @@ class RefractionDistortion(Distortion):
 
     @staticmethod
     def __call__(psf: Tensor) -> ApplyDistortion:
-        return lambda image: fft_conv(image, psf)
+        assert psf.dtype == torch.float32, psf.dtype
+        # the same psf is usually applied to many images
+        psf_spectrum, psf_size = torch.fft.rfft2(psf), psf.shape[-2:]
+        return lambda image: fft_conv_precomputed(
+            image, psf_spectrum, psf_size
+        )
 
 
 def _demo():
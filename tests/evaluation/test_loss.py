@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Callable
+from functools import lru_cache
 from unittest import TestCase
 import torch
 from torch import Tensor
@@ -16,15 +17,20 @@ def _check_zero_zero(
     return loss(pred, target)
 
 
-def _check_nonzero_nonzero(
-    loss: Callable[[Tensor, Tensor], Tensor], shape: Shape = (2, 3, 128, 256)
-) -> Tensor:
+@lru_cache(maxsize=None)
+def _nonzero_pair(shape: Shape) -> tuple[Tensor, Tensor]:
     pred = torch.zeros(shape)
     pred[0, 0, 16:48, 0:32] = 0.5
-    pred.requires_grad_()
     target = torch.ones(shape)
     target[0, 0, 0:32, 0:32] = 0.5
-    target.requires_grad_()
+    return pred, target
+
+
+def _check_nonzero_nonzero(
+    loss: Callable[[Tensor, Tensor], Tensor], shape: Shape = (2, 3, 128, 256)
+) -> Tensor:
+    # clone, so that every test gets its own leaf tensors
+    pred, target = (t.clone().requires_grad_() for t in _nonzero_pair(shape))
     return loss(pred, target)
 
 
@@ -41,10 +47,68 @@ class TestMSSSIM(TestCase):
         loss = _check_nonzero_nonzero(
             MultiScaleSSIMLoss(reduction="none"), shape=(2, 3, 256, 256)
         )
-        assert_close(loss, torch.tensor([0.707713723182, 0.706974804401]))
+        assert_close(loss, torch.tensor([0.707752579150, 0.707013552227]))
         self.assertTrue(loss.requires_grad)
 
 
+class TestSeparableSSIM(TestCase):
+    """
+    `olimp.evaluation.loss.piq` replaces `_ssim_per_channel` of piq
+    """
+
+    def setUp(self):
+        generator = torch.Generator().manual_seed(0)
+        shape = (2, 3, 192, 176)
+        self.x = torch.rand(shape, dtype=torch.float64, generator=generator)
+        # similar images, so that SSIM isn't close to zero
+        noise = torch.rand(shape, dtype=torch.float64, generator=generator)
+        self.y = 0.8 * self.x + 0.2 * noise
+
+    def test_per_channel(self):
+        from piq.functional import gaussian_filter
+        from olimp.evaluation.loss.piq import (
+            _separable_ssim_per_channel,
+            _piq_ssim_per_channel,
+        )
+
+        kernel = gaussian_filter(11, 1.5, dtype=torch.float64)
+        kernel = kernel.repeat(3, 1, 1, 1)
+        for actual, expected in zip(
+            _separable_ssim_per_channel(self.x, self.y, kernel),
+            _piq_ssim_per_channel(self.x, self.y, kernel),
+            strict=True,
+        ):
+            assert_close(actual, expected)
+
+    def test_ssim_and_ms_ssim(self):
+        from importlib import import_module
+        from unittest.mock import patch
+        from piq import ssim, multi_scale_ssim
+        from olimp.evaluation.loss.piq import _piq_ssim_per_channel
+
+        def original(function, *args):
+            with (
+                patch.object(
+                    import_module("piq.ssim"),
+                    "_ssim_per_channel",
+                    _piq_ssim_per_channel,
+                ),
+                patch.object(
+                    import_module("piq.ms_ssim"),
+                    "_ssim_per_channel",
+                    _piq_ssim_per_channel,
+                ),
+            ):
+                return function(*args)
+
+        for function in (ssim, multi_scale_ssim):
+            with self.subTest(function=function.__name__):
+                assert_close(
+                    function(self.x, self.y),
+                    original(function, self.x, self.y),
+                )
+
+
 class TestSSIM(TestCase):
     def test_empty_zero_images(self):
         from olimp.evaluation.loss.ssim import SSIMLoss
@@ -83,6 +147,56 @@ class TestRMS(TestCase):
         assert_close(loss, torch.tensor([0.0355894602835, 0.0]))
         self.assertTrue(loss.requires_grad)
 
+    def test_generator_is_reproducible(self):
+        from olimp.evaluation.loss.rms import RMS
+
+        losses = [
+            _check_nonzero_nonzero(
+                RMS(
+                    "lab",
+                    reduction="none",
+                    generator=torch.Generator().manual_seed(0),
+                )
+            )
+            for _ in range(2)
+        ]
+        assert_close(losses[0], losses[1])
+        self.assertEqual(losses[0][1].item(), 0.0)
+
+    def test_generator_device_not_ambient(self):
+        from olimp.evaluation.loss.rms import (
+            RMS,
+            RMS_map,
+            generate_random_neighbors,
+        )
+
+        generator = torch.Generator()
+        img1, img2 = (
+            torch.rand((2, 3, 64, 48), generator=generator.manual_seed(i))
+            for i in range(2)
+        )
+
+        def compute():
+            return (
+                generate_random_neighbors(
+                    img1[0], img2[0], generator=generator.manual_seed(0)
+                ),
+                RMS_map(
+                    img1[0], img2[0], "lab", generator=generator.manual_seed(0)
+                ),
+                RMS("prolab", reduction="none", generator=generator)(
+                    img1, img2
+                ),
+            )
+
+        expected = compute()
+        # like the training loop, which runs under `with torch.device(...)`
+        with torch.device("meta"):
+            actual = compute()
+        for value, expected_value in zip(actual, expected, strict=True):
+            self.assertEqual(value.device, img1.device)
+            assert_close(value, expected_value)
+
 
 class TestChromaticityDifference(TestCase):
     def test_empty_zero_images(self):
@@ -118,6 +232,27 @@ class TestChromaticityDifference(TestCase):
         assert_close(loss, torch.tensor([0.040271583944, 3.65355923293e-8]))
         self.assertTrue(loss.requires_grad)
 
+    def test_prolab_zero_lightness(self):
+        from olimp.evaluation.loss.chromaticity_difference import (
+            _srgb2prolab_chromaticity,
+        )
+        from olimp.evaluation.cs import srgb2prolab
+
+        srgb = torch.rand(
+            (3, 8, 8), generator=torch.Generator().manual_seed(0)
+        )
+        srgb[:, :4] = 0.0
+        srgb.requires_grad_()
+
+        expected = srgb2prolab(srgb.detach())
+        expected[0][expected[0] == 0] = 1.0
+        expected = expected[1:3] / expected[0]
+
+        chromaticity = _srgb2prolab_chromaticity(srgb)
+        assert_close(chromaticity, expected)
+        chromaticity.sum().backward()
+        self.assertTrue(torch.isfinite(srgb.grad).all())
+
 
 class TestPSNR(TestCase):
     def test_empty_zero_images(self):
@@ -217,9 +352,16 @@ class TestNRMSE(TestCase):
     def test_empty_zero_images(self):
         from olimp.evaluation.loss.nrmse import NormalizedRootMSE
 
-        loss = _check_zero_zero(NormalizedRootMSE())
-        self.assertTrue(loss.requires_grad)
-        self.assertEqual(loss, 0.0)
+        for normalization in ("euclidean", "min-max", "mean"):
+            with self.subTest(normalization=normalization):
+                pred = torch.zeros((2, 3, 256, 192), requires_grad=True)
+                loss = NormalizedRootMSE(normalization)(
+                    pred, torch.zeros_like(pred)
+                )
+                self.assertTrue(loss.requires_grad)
+                self.assertEqual(loss, 0.0)
+                loss.backward()
+                self.assertTrue(pred.grad.isfinite().all())
 
     def test_nonzero_nonzero_euclidean(self):
         from olimp.evaluation.loss.nrmse import NormalizedRootMSE
@@ -307,6 +449,48 @@ class TestContrastSimilarity(TestCase):
         self.assertTrue(loss.requires_grad)
 
 
+def _contrast_l1_reference(img: Tensor, window_size: int) -> Tensor:
+    # the original loop of `ContrastLoss`, with its 256x256 crop replaced
+    # by the image size
+    img = img.permute(0, 2, 3, 1)
+    height, width = img.shape[1:3]
+    center = img[
+        :,
+        window_size : height - window_size,
+        window_size : width - window_size,
+    ]
+    diffs: list[Tensor] = []
+    for i in range(-window_size, window_size + 1):
+        for j in range(-window_size, window_size + 1):
+            if i == 0 and j == 0:
+                continue
+            shifted = img[
+                :,
+                window_size + i : height - window_size + i,
+                window_size + j : width - window_size + j,
+            ]
+            diffs.append(torch.sum(torch.abs(center - shifted), 3))
+    return torch.stack(diffs, dim=3)
+
+
+class TestContrastLoss(TestCase):
+    def _check_matches_loop(self, shape: Shape):
+        from olimp.evaluation.loss.ssim import ContrastLoss
+
+        img = torch.rand(shape, generator=torch.Generator().manual_seed(0))
+        contrast = ContrastLoss.calculate_contrast_oneimg_l1(img, 5)
+        self.assertEqual(
+            contrast.shape, (shape[0], shape[2] - 10, shape[3] - 10, 120)
+        )
+        assert_close(contrast, _contrast_l1_reference(img, 5))
+
+    def test_matches_loop_256(self):
+        self._check_matches_loop((1, 3, 256, 256))
+
+    def test_matches_loop_non_square(self):
+        self._check_matches_loop((2, 3, 40, 64))
+
+
 class TestVAELoss(TestCase):
     def test_empty_zero_images(self):
         from olimp.evaluation.loss.vae import vae_loss
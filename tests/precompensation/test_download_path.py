@@ -0,0 +1,57 @@
+from __future__ import annotations
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from pathlib import Path
+import os
+import torch
+from olimp.precompensation.nn.models.download_path import load_state_dict
+from olimp.precompensation.nn.models.vdsr import VDSR
+
+
+class TestLoadStateDict(TestCase):
+    def setUp(self):
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = str(Path(tmp_dir.name) / "vdsr.pth")
+
+    def _save(self, model: VDSR):
+        torch.save(model.state_dict(), self.path)
+
+    def _assert_same_weights(self, model: VDSR, expected: VDSR):
+        for (name, value), expected_value in zip(
+            model.state_dict().items(), expected.state_dict().values()
+        ):
+            self.assertTrue(torch.equal(value, expected_value), name)
+
+    def test_memoized_and_unmodified(self):
+        model = VDSR()
+        self._save(model)
+        state_dict = load_state_dict(self.path)
+        self._assert_same_weights(VDSR.from_path(self.path), model)
+        self.assertIs(load_state_dict(self.path), state_dict)
+        self.assertEqual(state_dict.keys(), model.state_dict().keys())
+        self._assert_same_weights(VDSR.from_path(self.path), model)
+
+    def test_replaced_checkpoint(self):
+        self._save(VDSR())
+        VDSR.from_path(self.path)
+
+        model = VDSR()
+        new_path = self.path + ".new"
+        torch.save(model.state_dict(), new_path)
+        # same size, so make sure the modification time differs too
+        stat = os.stat(self.path)
+        os.utime(new_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        os.replace(new_path, self.path)
+        self._assert_same_weights(VDSR.from_path(self.path), model)
+
+    def test_overwritten_in_place(self):
+        self._save(VDSR())
+        state_dict = load_state_dict(self.path)
+        VDSR.from_path(self.path)
+
+        torch.save({}, self.path)
+        # tensors loaded before the overwrite stay readable
+        self.assertTrue(all(v.isfinite().all() for v in state_dict.values()))
+        with self.assertRaises(RuntimeError):
+            VDSR.from_path(self.path)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+from unittest import TestCase
+from unittest.mock import patch
+from pydantic import TypeAdapter
+import torch
+from olimp.precompensation.nn.train.config.loss_function import LossFunction
+
+
+class TestLossFunction(TestCase):
+    def _load(self, config: dict[str, object]):
+        return TypeAdapter(LossFunction).validate_python(config).load(None)
+
+    def test_ssim_torch_compile(self):
+        with patch("torch.compile", side_effect=lambda f: f) as compile:
+            loss = self._load({"name": "SSIM", "torch_compile": True})
+        compile.assert_called_once()
+
+        image = torch.rand(1, 3, 32, 32)
+        value = loss(image, image, lambda image: image, ())
+        torch.testing.assert_close(value, torch.tensor(0.0))
+
+    def test_ssim_not_compiled_by_default(self):
+        with patch("torch.compile") as compile:
+            self._load({"name": "SSIM"})
+        compile.assert_not_called()
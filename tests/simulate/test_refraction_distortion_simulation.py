@@ -29,3 +29,23 @@ class TestRefractionDistortionSimulator(TestCase):
         self.distortion = RefractionDistortion()(K_4d)
         result_4d = self.distortion(I_4d)
         self.assertEqual(result_4d.shape, (2, 3, 64, 64))
+
+    def test_odd_size_matches_complex_fft(self):
+        image = torch.rand(3, 63, 45, dtype=torch.float)
+        psf = torch.rand(1, 63, 45, dtype=torch.float)
+        result = RefractionDistortion()(psf)(image)
+        expected = torch.real(
+            torch.fft.ifft2(torch.fft.fft2(image) * torch.fft.fft2(psf))
+        )
+        torch.testing.assert_close(result, expected)
+
+    def test_mismatched_width(self):
+        distortion = RefractionDistortion()(torch.rand(1, 32, 64))
+        # (32, 64) and (32, 65) share the rfft2 spectrum shape
+        with self.assertRaises(AssertionError) as context:
+            distortion(torch.rand(1, 3, 32, 65))
+        self.assertEqual(
+            str(context.exception),
+            "Expected equal shapes, got: "
+            "image=torch.Size([32, 65]), kernel=(32, 64)",
+        )
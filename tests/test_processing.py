@@ -0,0 +1,77 @@
+from __future__ import annotations
+from unittest import TestCase, skipUnless
+import torch
+from torch.testing import assert_close
+from olimp.processing import fft_conv, resize_kernel, scale_value
+
+
+class TestResizeKernel(TestCase):
+    def test_fft_constant(self):
+        kernel = torch.full((1, 1, 16, 16), 0.25)
+        resized = resize_kernel(kernel, (33, 40), mode="fft")
+        self.assertEqual(resized.shape, (1, 1, 33, 40))
+        assert_close(resized, torch.full((1, 1, 33, 40), 0.25))
+
+    def test_fft_round_trip(self):
+        kernel = torch.rand(
+            (1, 1, 31, 40),
+            dtype=torch.float64,
+            generator=torch.Generator().manual_seed(0),
+        )
+        for target_size in ((64, 80), (63, 81)):
+            upscaled = resize_kernel(kernel, target_size, mode="fft")
+            assert_close(resize_kernel(upscaled, (31, 40), mode="fft"), kernel)
+
+
+class TestFFTConv(TestCase):
+    @skipUnless(torch.cuda.is_available(), "half precision FFT needs CUDA")
+    def test_fp16_matches_fp32(self):
+        generator = torch.Generator().manual_seed(0)
+        image = torch.rand((2, 3, 256, 256), generator=generator)
+        psf = torch.rand((2, 1, 256, 256), generator=generator)
+        psf /= psf.sum(dim=(-2, -1), keepdim=True)
+        image, psf = image.cuda(), psf.cuda()
+        result = fft_conv(image, psf, precision="fp16")
+        self.assertEqual(result.dtype, torch.float32)
+        assert_close(result, fft_conv(image, psf), atol=1e-2, rtol=1e-2)
+
+    def test_fp16_rejects_non_power_of_two(self):
+        image = torch.rand((1, 3, 64, 96))
+        with self.assertRaises(AssertionError) as context:
+            fft_conv(image, torch.rand((1, 1, 64, 96)), precision="fp16")
+        self.assertEqual(
+            str(context.exception),
+            "Half precision FFT needs power of two sizes, got: (64, 96)",
+        )
+
+
+class TestScaleValue(TestCase):
+    def test_rescale(self):
+        arr = torch.tensor([[2.0, 4.0], [3.0, 6.0]])
+        assert_close(
+            scale_value(arr, -1.0, 1.0),
+            torch.tensor([[-1.0, 0.0], [-0.5, 1.0]]),
+        )
+        assert_close(arr, torch.tensor([[2.0, 4.0], [3.0, 6.0]]))
+
+    def test_constant_inside_range(self):
+        arr = torch.full((2, 3), 0.25, requires_grad=True)
+        scaled = scale_value(arr)
+        assert_close(scaled, torch.full((2, 3), 0.25))
+        scaled.sum().backward()
+        self.assertTrue(arr.grad.isfinite().all())
+
+    def test_constant_outside_range(self):
+        # a constant maps to the closest bound
+        assert_close(
+            scale_value(torch.full((4,), 3.0), 0.0, 1.0), torch.ones(4)
+        )
+        assert_close(
+            scale_value(torch.full((4,), -2.0), 0.0, 1.0), torch.zeros(4)
+        )
+
+    def test_inplace(self):
+        arr = torch.tensor([1.0, 2.0, 5.0])
+        scaled = scale_value(arr, 0.0, 4.0, inplace=True)
+        self.assertEqual(scaled.data_ptr(), arr.data_ptr())
+        assert_close(arr, torch.tensor([0.0, 1.0, 4.0]))